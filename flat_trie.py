@@ -0,0 +1,387 @@
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the Python walk
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; fall back to the Python walk
+    njit = None
+
+if np is not None:
+    _M1 = np.uint64(0x5555555555555555)
+    _M2 = np.uint64(0x3333333333333333)
+    _M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+    _ONE = np.uint64(1)
+
+    def _popcount64(x):
+        """
+        Counts the set bits of a uint64 with shift-and-add steps only
+        (no multiply, so no wraparound), compiling to a handful of ALU
+        instructions under Numba.
+
+        Args:
+            x (uint64): The word to count.
+
+        Returns:
+            uint64: The number of set bits in 'x'.
+        """
+        x = x - ((x >> 1) & _M1)
+        x = (x & _M2) + ((x >> 2) & _M2)
+        x = (x + (x >> 4)) & _M4
+        x = x + (x >> 8)
+        x = x + (x >> 16)
+        x = x + (x >> 32)
+        return x & np.uint64(0x7F)
+
+    def _walk_packed(bm_lo, bm_hi, offsets, child_ids, key_bytes):
+        """
+        Descent over the packed node arrays.
+
+        For each key byte, test the matching bit in the node's two-word
+        bitmap and compute the child's rank as the popcount of the bits
+        below it; the child ID then sits at offsets[node] + rank in the
+        packed child array.
+
+        Args:
+            bm_lo (uint64 array): Bits 0-63 of each node's child bitmap.
+            bm_hi (uint64 array): Bits 64-127 of each node's child bitmap.
+            offsets (uint32 array): Start of each node's packed children.
+            child_ids (uint32 array): All child IDs, packed per node.
+            key_bytes (uint8 array): The key to follow from the root.
+
+        Returns:
+            int: The node ID reached, or -1 if the path does not exist.
+        """
+        nid = 0
+        for c in key_bytes:
+            lo = bm_lo[nid]
+            if c < 64:
+                bit = _ONE << np.uint64(c)
+                if (lo & bit) == 0:
+                    return -1
+                rank = _popcount64(lo & (bit - _ONE))
+            else:
+                hi = bm_hi[nid]
+                bit = _ONE << np.uint64(c - 64)
+                if (hi & bit) == 0:
+                    return -1
+                rank = _popcount64(lo) + _popcount64(hi & (bit - _ONE))
+            nid = child_ids[offsets[nid] + rank]
+        return nid
+
+    if njit is not None:
+        _popcount64 = njit(cache=True)(_popcount64)
+        _walk_packed = njit(cache=True)(_walk_packed)
+else:
+    _walk_packed = None
+
+
+class FlatTrie:
+    """
+    A Trie stored as parallel per-node arrays instead of a graph of
+    TrieNode objects.
+
+    Each node is a row across three lists indexed by node ID: a 128-bit
+    child bitmap, a densely packed list of child node IDs, and a value.
+    Bit c of the bitmap says whether the node has a child for character
+    chr(c); the child's position inside the packed list is the popcount
+    of the bitmap bits below c, so a lookup is one mask plus one
+    int.bit_count() plus one list index.
+
+    Most nodes in realistic keysets have only a few children, so packing
+    them densely stores 1-3 entries per node instead of a fixed 128-slot
+    block, while lookups stay O(1) per character.
+
+    Attributes:
+        bitmaps (list of int): Per-node child-presence bitmaps.
+        children (list of list): Per-node packed child node IDs, ordered
+                                 by character.
+        values (list): Per-node values; None if the node holds no value.
+        size (int): The total number of keys stored in the trie.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty FlatTrie containing only the root node (ID 0).
+        """
+        self.bitmaps = []
+        self.children = []
+        self.values = []
+        self.size = 0
+        self._packed = None  # cached compiled-walk arrays; dropped on mutation
+        self._alloc()  # root
+
+    def _alloc(self):
+        """
+        Allocates a fresh node: an empty bitmap, no packed children and a
+        None value.
+
+        Returns:
+            int: The ID of the new node.
+        """
+        self.bitmaps.append(0)
+        self.children.append([])
+        self.values.append(None)
+        return len(self.values) - 1
+
+    def put(self, key, value=None):
+        """
+        Inserts a key-value pair into the trie. If the key already exists,
+        updates its value.
+
+        Args:
+            key (str): The string key to insert or update.
+            value (Any, optional): The value to associate with the key.
+                                   Defaults to None.
+
+        Raises:
+            TypeError: If key is not a non-empty ASCII string.
+        """
+        if not isinstance(key, str) or not key or not key.isascii():
+            raise TypeError(f"Illegal argument for put: key = {key} must be a non-empty ASCII string")
+
+        self._packed = None
+        bitmaps = self.bitmaps
+        children = self.children
+        nid = 0
+        for c in key.encode("ascii"):
+            bit = 1 << c
+            bm = bitmaps[nid]
+            rank = (bm & (bit - 1)).bit_count()
+            if bm & bit:
+                nid = children[nid][rank]
+            else:
+                child = self._alloc()
+                children[nid].insert(rank, child)
+                bitmaps[nid] = bm | bit
+                nid = child
+        if self.values[nid] is None:
+            self.size += 1
+        self.values[nid] = value
+
+    def _walk(self, s):
+        """
+        Walks the trie along the characters of 's'.
+
+        Args:
+            s (str): The string to follow from the root.
+
+        Returns:
+            int: The ID of the node reached, or -1 if the path does not exist.
+        """
+        if njit is not None:
+            # The whole descent runs as compiled code: two masked
+            # popcounts per character instead of Python big-int ops.
+            if self._packed is None:
+                self._packed = self._pack()
+            bm_lo, bm_hi, offsets, child_ids = self._packed
+            return int(_walk_packed(
+                bm_lo, bm_hi, offsets, child_ids,
+                np.frombuffer(s.encode("ascii"), dtype=np.uint8),
+            ))
+
+        bitmaps = self.bitmaps
+        children = self.children
+        nid = 0
+        for c in s.encode("ascii"):
+            bit = 1 << c
+            bm = bitmaps[nid]
+            if not bm & bit:
+                return -1
+            nid = children[nid][(bm & (bit - 1)).bit_count()]
+        return nid
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key in the trie.
+
+        Args:
+            key (str): The string key to lookup.
+
+        Returns:
+            Any: The value stored for this key, or None if the key does not exist.
+
+        Raises:
+            TypeError: If key is not a non-empty ASCII string.
+        """
+        if not isinstance(key, str) or not key or not key.isascii():
+            raise TypeError(f"Illegal argument for get: key = {key} must be a non-empty ASCII string")
+
+        nid = self._walk(key)
+        return self.values[nid] if nid >= 0 else None
+
+    def _pack(self):
+        """
+        Builds fixed-width views of the trie for the compiled walk.
+
+        The per-node Python-int bitmaps become two parallel uint64 arrays
+        (low and high 64 bits), and the per-node child lists are
+        flattened into one uint32 array with a prefix-sum offset table.
+        The result is cached by _walk and rebuilt after any put.
+
+        Returns:
+            tuple: (bm_lo, bm_hi, offsets, child_ids) NumPy arrays.
+        """
+        count = len(self.bitmaps)
+        bm_lo = np.empty(count, dtype=np.uint64)
+        bm_hi = np.empty(count, dtype=np.uint64)
+        offsets = np.empty(count + 1, dtype=np.uint32)
+        child_ids = np.empty(sum(len(row) for row in self.children),
+                             dtype=np.uint32)
+
+        mask = (1 << 64) - 1
+        pos = 0
+        for i, bm in enumerate(self.bitmaps):
+            bm_lo[i] = bm & mask
+            bm_hi[i] = bm >> 64
+            offsets[i] = pos
+            row = self.children[i]
+            child_ids[pos:pos + len(row)] = row
+            pos += len(row)
+        offsets[count] = pos
+        return bm_lo, bm_hi, offsets, child_ids
+
+    def has_prefix(self, prefix) -> bool:
+        """
+        Returns True if there is at least one word in the trie that starts
+        with 'prefix'.
+
+        Args:
+            prefix (str): The prefix to check.
+
+        Returns:
+            bool: True if any word starts with 'prefix', False otherwise.
+
+        Raises:
+            TypeError: If prefix is not a string.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("prefix must be a string")
+
+        if not prefix.isascii():
+            return False
+        return self._walk(prefix) >= 0
+
+    def is_empty(self):
+        """
+        Checks if the trie is empty (i.e., contains no keys).
+
+        Returns:
+            bool: True if the trie has size 0, False otherwise.
+        """
+        return self.size == 0
+
+    def keys(self):
+        """
+        Returns a list of all keys stored in the trie, in sorted order.
+
+        Returns:
+            list of str: All the keys in the trie.
+        """
+        result = []
+        self._collect(0, "", result)
+        return result
+
+    def _collect(self, nid, prefix, result):
+        """
+        Helper method to collect all keys below the given node ID.
+
+        Runs an iterative depth-first search with an explicit stack and a
+        single reusable bytearray holding the current path, matching
+        Trie._collect: no call frames are allocated while traversing, and
+        keys longer than the recursion limit are handled fine.
+
+        Args:
+            nid (int): The node ID to collect from.
+            prefix (str): The characters on the path from the root to 'nid'.
+            result (list of str): The list to accumulate the full keys.
+        """
+        bitmaps = self.bitmaps
+        children = self.children
+        values = self.values
+
+        path = bytearray(prefix.encode("ascii"))
+        if values[nid] is not None:
+            result.append(prefix)
+
+        # Each frame is [node ID, path length on entry, remaining child
+        # bitmap, next packed-child position].
+        stack = [[nid, len(path), bitmaps[nid], 0]]
+        while stack:
+            frame = stack[-1]
+            current, base, bm, pos = frame
+            if not bm:
+                stack.pop()
+                continue
+            low = bm & -bm  # lowest set bit = next character in order
+            frame[2] = bm ^ low
+            frame[3] = pos + 1
+
+            child = children[current][pos]
+            del path[base:]
+            path.append(low.bit_length() - 1)
+            if values[child] is not None:
+                result.append(path.decode("ascii"))
+            stack.append([child, len(path), bitmaps[child], 0])
+
+    def compact(self):
+        """
+        Rebuilds the per-node arrays in breadth-first order.
+
+        After bulk insertion, node IDs reflect insertion order, so the
+        children of a node can be scattered across the arrays. A BFS
+        renumbering places sibling nodes at adjacent IDs, which keeps
+        traversals of the rebuilt trie within contiguous rows.
+        """
+        old_bitmaps = self.bitmaps
+        old_children = self.children
+        old_values = self.values
+        count = len(old_values)
+        new_bitmaps = [0] * count
+        new_children = [None] * count
+        new_values = [None] * count
+
+        new_id = {0: 0}
+        queue = deque([0])
+        next_free = 1
+        while queue:
+            old = queue.popleft()
+            new = new_id[old]
+            new_bitmaps[new] = old_bitmaps[old]
+            new_values[new] = old_values[old]
+            row = []
+            for child in old_children[old]:
+                new_id[child] = next_free
+                row.append(next_free)
+                next_free += 1
+                queue.append(child)
+            new_children[new] = row
+
+        self.bitmaps = new_bitmaps
+        self.children = new_children
+        self.values = new_values
+        self._packed = None
+
+
+if __name__ == "__main__":
+    trie = FlatTrie()
+    words = ["apple", "application", "banana", "cat"]
+    for i, word in enumerate(words):
+        trie.put(word, i)
+
+    assert trie.size == 4
+    assert trie.get("apple") == 0
+    assert trie.get("app") is None
+    assert trie.has_prefix("app") == True
+    assert trie.has_prefix("bat") == False
+    assert trie.keys() == ["apple", "application", "banana", "cat"]
+
+    trie.compact()
+    assert trie.get("application") == 1
+    assert trie.has_prefix("ban") == True
+    assert trie.keys() == ["apple", "application", "banana", "cat"]
+
+    print("All tests passed successfully!")
@@ -1,104 +1,64 @@
-class TrieNode:
-    """
-    A TrieNode represents a single node in the Trie.
-    
-    Attributes:
-        children (dict): A dictionary mapping characters to child TrieNode instances.
-        value (Any): The value associated with the node. None if no value is set.
-        pass_count (int): The number of words that pass through this node.
-    """
-    def __init__(self):
-        self.children = {}
-        self.value = None
-        self.pass_count = 0
+from trie_homework_task1 import Trie
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; fall back to the pure-Python scan
+    np = None
 
-class Trie:
-    """
-    A Trie (prefix tree) for storing string keys with optional associated values.
-    
-    Attributes:
-        root (TrieNode): The root node of the Trie.
-        size (int): The total number of keys stored in the Trie.
-    """
-    def __init__(self):
-        """
-        Initializes a new Trie instance with an empty root node and size zero.
-        """
-        self.root = TrieNode()
-        self.size = 0
-
-    def put(self, key, value=None):
-        """
-        Inserts a key-value pair into the Trie. If the key already exists,
-        updates its value.
-
-        Args:
-            key (str): The string key to insert or update in the Trie.
-            value (Any, optional): The value to associate with the key.
-                                   Defaults to None.
-
-        Raises:
-            TypeError: If key is not a non-empty string.
-        """
-        if not isinstance(key, str) or not key:
-            raise TypeError(f"Illegal argument for put: key = {key} must be a non-empty string")
-
-        current = self.root
-        for char in key:
-            if char not in current.children:
-                current.children[char] = TrieNode()
-            current = current.children[char]
-            # Increase the pass_count for each node visited
-            current.pass_count += 1
-
-        if current.value is None:
-            self.size += 1
-        current.value = value
-
-    def get(self, key):
-        """
-        Retrieves the value associated with a given key in the Trie.
 
-        Args:
-            key (str): The string key to lookup.
-
-        Returns:
-            Any: The value stored for this key, or None if the key does not exist.
+def _common_bytes_len(a, b):
+    """
+    Returns the length of the common prefix of two byte strings.
 
-        Raises:
-            TypeError: If key is not a non-empty string.
-        """
-        if not isinstance(key, str) or not key:
-            raise TypeError(f"Illegal argument for get: key = {key} must be a non-empty string")
+    Compares 8 bytes per iteration by XOR-ing 64-bit words: a zero XOR
+    means the whole chunk matches, otherwise the position of the highest
+    set bit pinpoints the first differing byte. This amortizes the
+    interpreter overhead of the scan roughly eightfold versus comparing
+    one byte at a time; the tail shorter than 8 bytes is compared directly.
 
-        current = self.root
-        for char in key:
-            if char not in current.children:
-                return None
-            current = current.children[char]
-        return current.value
+    Args:
+        a (bytes): The first byte string.
+        b (bytes): The second byte string.
 
-    # Інші методи (delete, is_empty, тощо) можемо додати, якщо потрібно, 
-    # але для завдання з пошуком спільного префікса вони не обов'язкові.
+    Returns:
+        int: The number of leading bytes shared by 'a' and 'b'.
+    """
+    n = min(len(a), len(b))
+    i = 0
+    end = n - 7
+    while i < end:
+        x = int.from_bytes(a[i:i + 8], "big") ^ int.from_bytes(b[i:i + 8], "big")
+        if x:
+            return i + 8 - (x.bit_length() + 7) // 8
+        i += 8
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
 
 
 class LongestCommonWord(Trie):
     """
     A class that extends Trie to find the longest common prefix (LCP)
     among a list of input strings.
+
+    The Trie machinery is kept for API compatibility, but the LCP itself
+    is computed with a direct scan over the strings, shrinking a running
+    prefix and stopping as soon as it is empty. This avoids allocating
+    one TrieNode per character of every input string.
     """
 
     def find_longest_common_word(self, strings) -> str:
         """
         Finds the longest common prefix among all strings in the input list.
 
-        If the list is empty, or if there's no common prefix, returns an empty string.
-        Raises TypeError if 'strings' is not a list of strings.
+        If the list is empty, or if there's no common prefix, returns an
+        empty string.
 
-        The time complexity is O(S), where S is the total length of all strings,
-        because we insert each string into the Trie, then traverse the Trie once
-        to find the longest common prefix.
+        The time complexity is O(|strings[0]| + N * L), where N is the
+        number of strings and L is the length of the answer: after the
+        first comparison the running prefix never grows, so each later
+        string is compared against at most L characters, and the scan
+        stops early the moment the prefix becomes empty.
 
         Args:
             strings (list): A list of strings for which to find the common prefix.
@@ -118,56 +78,70 @@ class LongestCommonWord(Trie):
             if not isinstance(s, str):
                 return ""  # or raise TypeError(f"Invalid element in strings: {s}")
 
-        # Insert all strings into the Trie
-        # We'll also track how many words we have (needed for pass_count check)
-        total_strings = len(strings)
-        for s in strings:
-            # Each time we put a string, we start from the root; 
-            # increment the pass_count for each node as we go along
-            self._insert_with_passcount(s)
-
-        # Now traverse from the root, collecting characters while:
-        # 1) There's exactly 1 child in the current node
-        # 2) That child's pass_count == total_strings
-        longest_common_prefix = ""
-        current_node = self.root
-
-        # We continue as long as there's exactly one child
-        # and that child is common to all strings.
-        while True:
-            if len(current_node.children) != 1:
-                break  # more than 1 child or 0 children => stop
-            (char, next_node), = current_node.children.items()
-
-            # If pass_count is not equal to total_strings,
-            # it means not all strings share this path
-            if next_node.pass_count != total_strings:
-                break
-
-            # Add this char to our prefix and move deeper
-            longest_common_prefix += char
-            current_node = next_node
-
-        return longest_common_prefix
-
-    def _insert_with_passcount(self, key):
+        # For large ASCII inputs, compare all strings at once with NumPy:
+        # the per-character Python loop becomes a single vectorized byte
+        # compare over a contiguous 2D uint8 array.
+        if np is not None and len(strings) > 2 and all(s.isascii() for s in strings):
+            return self._lcp_numpy(strings)
+
+        # Fold over the strings, shrinking the running prefix against each
+        # one. Every comparison is bounded by the current prefix length,
+        # and the loop stops outright once the prefix is empty — the
+        # cheapest possible outcome for divergent inputs. A trailing
+        # partial UTF-8 character (only possible at a mismatch) is dropped
+        # by the lenient decode.
+        lcp = strings[0].encode("utf-8")
+        for s in strings[1:]:
+            n = _common_bytes_len(lcp, s.encode("utf-8"))
+            if n == 0:
+                return ""
+            if n < len(lcp):
+                lcp = lcp[:n]
+        return lcp.decode("utf-8", "ignore")
+
+    @staticmethod
+    def _lcp_numpy(strings):
         """
-        A helper method that inserts a key into the existing Trie.
-        Increments pass_count for each node on the path.
+        Vectorized LCP for ASCII strings using a 2D uint8 byte array.
+
+        Every string is truncated to the shortest length L and packed into
+        an (N, L) array. Columns are compared against the first row in
+        blocks, stopping at the first block containing a divergence, so a
+        short answer costs one block of work no matter how long the
+        strings are. The LCP length is the index of the first column where
+        any row differs.
 
         Args:
-            key (str): The string to insert into the Trie.
+            strings (list of str): Non-empty list of ASCII strings.
+
+        Returns:
+            str: The longest common prefix of all strings in the list.
         """
-        current = self.root
-        # Root node pass_count isn't strictly needed if we only
-        # track deeper nodes, but let's increment it consistently
-        current.pass_count += 1  
-
-        for char in key:
-            if char not in current.children:
-                current.children[char] = TrieNode()
-            current = current.children[char]
-            current.pass_count += 1
+        # The answer can never exceed the LCP of any single pair, so a
+        # cheap compare of the first two strings bounds how many bytes
+        # per string are worth packing at all. With a short answer this
+        # shrinks the copied buffer from O(N * min length) to O(N * LCP).
+        bound = _common_bytes_len(
+            strings[0].encode("ascii"), strings[1].encode("ascii")
+        )
+        if bound == 0:
+            return ""
+        L = min(min(map(len, strings)), bound)
+        if L == 0:
+            return ""
+        buf = np.frombuffer(
+            b"".join(s.encode("ascii")[:L] for s in strings), dtype=np.uint8
+        ).reshape(len(strings), L)
+
+        block_size = 1024
+        offset = 0
+        while offset < L:
+            block = buf[:, offset:offset + block_size]
+            mask = (block == block[0]).all(axis=0)
+            if not mask.all():
+                return strings[0][:offset + int(np.argmin(mask))]
+            offset += block.shape[1]
+        return strings[0][:L]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,217 @@
+class RadixNode:
+    """
+    A RadixNode represents a single node in the RadixTrie.
+
+    Attributes:
+        children (dict): Maps the first character of an edge label to a
+                         (label, child RadixNode) tuple.
+        value (Any): The value associated with the node. None if no value is set.
+    """
+    __slots__ = ("children", "value")
+
+    def __init__(self):
+        self.children = {}
+        self.value = None
+
+
+class RadixTrie:
+    """
+    A path-compressed trie (radix / PATRICIA tree) for storing string keys
+    with optional associated values.
+
+    Non-branching chains of characters are collapsed into a single edge
+    carrying a string label, so the node count is proportional to the
+    number of branch points rather than the total number of characters.
+    Walking an edge compares a slice of the key against the label in one
+    C-level string comparison instead of one dict lookup per character.
+
+    Attributes:
+        root (RadixNode): The root node of the trie.
+        size (int): The total number of keys stored in the trie.
+    """
+    def __init__(self):
+        """
+        Initializes a new RadixTrie instance with an empty root node and size zero.
+        """
+        self.root = RadixNode()
+        self.size = 0
+
+    @staticmethod
+    def _common_len(a, b):
+        """
+        Returns the length of the common prefix of two strings.
+
+        Args:
+            a (str): The first string.
+            b (str): The second string.
+
+        Returns:
+            int: The number of leading characters shared by 'a' and 'b'.
+        """
+        n = min(len(a), len(b))
+        i = 0
+        while i < n and a[i] == b[i]:
+            i += 1
+        return i
+
+    def put(self, key, value=None):
+        """
+        Inserts a key-value pair into the trie. If the key already exists,
+        updates its value. Edges are split in place when a new key diverges
+        in the middle of an existing label.
+
+        Args:
+            key (str): The string key to insert or update.
+            value (Any, optional): The value to associate with the key.
+                                   Defaults to None.
+
+        Raises:
+            TypeError: If key is not a non-empty string.
+        """
+        if not isinstance(key, str) or not key:
+            raise TypeError(f"Illegal argument for put: key = {key} must be a non-empty string")
+
+        node = self.root
+        rest = key
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                leaf = RadixNode()
+                node.children[rest[0]] = (rest, leaf)
+                node = leaf
+                rest = ""
+                break
+
+            label, child = edge
+            c = self._common_len(label, rest)
+            if c == len(label):
+                node = child
+                rest = rest[c:]
+                continue
+
+            # The key diverges inside this edge: split the label at c.
+            mid = RadixNode()
+            mid.children[label[c]] = (label[c:], child)
+            node.children[label[0]] = (label[:c], mid)
+            if c == len(rest):
+                node = mid
+                rest = ""
+            else:
+                leaf = RadixNode()
+                mid.children[rest[c]] = (rest[c:], leaf)
+                node = leaf
+                rest = ""
+            break
+
+        if node.value is None:
+            self.size += 1
+        node.value = value
+
+    def get(self, key):
+        """
+        Retrieves the value associated with a given key in the trie.
+
+        Args:
+            key (str): The string key to lookup.
+
+        Returns:
+            Any: The value stored for this key, or None if the key does not exist.
+
+        Raises:
+            TypeError: If key is not a non-empty string.
+        """
+        if not isinstance(key, str) or not key:
+            raise TypeError(f"Illegal argument for get: key = {key} must be a non-empty string")
+
+        node = self.root
+        rest = key
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                return None
+            label, child = edge
+            if not rest.startswith(label):
+                return None  # the key ends (or diverges) inside this edge
+            node = child
+            rest = rest[len(label):]
+        return node.value
+
+    def has_prefix(self, prefix) -> bool:
+        """
+        Returns True if there is at least one word in the trie that starts
+        with 'prefix'. Case-sensitive comparisons.
+
+        Args:
+            prefix (str): The prefix to check.
+
+        Returns:
+            bool: True if any word starts with 'prefix', False otherwise.
+
+        Raises:
+            TypeError: If prefix is not a string.
+        """
+        if not isinstance(prefix, str):
+            raise TypeError("prefix must be a string")
+
+        node = self.root
+        rest = prefix
+        while rest:
+            edge = node.children.get(rest[0])
+            if edge is None:
+                return False
+            label, child = edge
+            if len(rest) <= len(label):
+                return label.startswith(rest)  # prefix ends inside this edge
+            if not rest.startswith(label):
+                return False
+            node = child
+            rest = rest[len(label):]
+        return self.size > 0
+
+    def is_empty(self):
+        """
+        Checks if the trie is empty (i.e., contains no keys).
+
+        Returns:
+            bool: True if the trie has size 0, False otherwise.
+        """
+        return self.size == 0
+
+    def keys(self):
+        """
+        Returns a list of all keys stored in the trie, in sorted order.
+
+        Returns:
+            list of str: All the keys in the trie.
+        """
+        result = []
+        stack = [("", self.root)]
+        while stack:
+            path, node = stack.pop()
+            if node.value is not None:
+                result.append(path)
+            for first in sorted(node.children, reverse=True):
+                label, child = node.children[first]
+                stack.append((path + label, child))
+        return result
+
+
+if __name__ == "__main__":
+    trie = RadixTrie()
+    words = ["interspecies", "interstellar", "interstate", "inter", "apple"]
+    for i, word in enumerate(words):
+        trie.put(word, i)
+
+    assert trie.size == 5
+    assert trie.get("interstate") == 2
+    assert trie.get("inter") == 3
+    assert trie.get("inters") is None
+    assert trie.has_prefix("inters") == True
+    assert trie.has_prefix("interstellar") == True
+    assert trie.has_prefix("intersz") == False
+    assert trie.keys() == sorted(words)
+
+    trie.put("inter", 42)  # update must not grow size
+    assert trie.size == 5 and trie.get("inter") == 42
+
+    print("All tests passed successfully!")
@@ -1,20 +1,41 @@
+from concurrent.futures import ThreadPoolExecutor
+
+ALPHABET_SIZE = 128  # ASCII alphabet; children are indexed by ord(char)
+
+# Below this many keys, a C-level startswith/endswith scan over the key
+# list beats walking the trie one child slot at a time.
+SMALL_TRIE_THRESHOLD = 16
+
+
 class TrieNode:
     """
     A TrieNode represents a single node in the Trie.
-    
+
+    Children are stored in a fixed-size list indexed by the character's
+    ASCII ordinal instead of a dict: this removes hashing from every
+    lookup and keeps the per-node memory layout flat and predictable.
+
     Attributes:
-        children (dict): A dictionary mapping characters to child TrieNode instances.
+        children (list): A list of ALPHABET_SIZE slots; slot ord(char)
+                         holds the child TrieNode or None.
+        child_count (int): The number of non-None children slots.
         value (Any): The value associated with the node. None if no value is set.
+        pass_count (int): The number of words that pass through this node.
     """
+    __slots__ = ("children", "child_count", "value", "pass_count")
+
     def __init__(self):
-        self.children = {}
+        self.children = [None] * ALPHABET_SIZE
+        self.child_count = 0
         self.value = None
+        self.pass_count = 0
 
 
 class Trie:
     """
-    A Trie (prefix tree) for storing string keys with optional associated values.
-    
+    A Trie (prefix tree) for storing ASCII string keys with optional
+    associated values.
+
     Attributes:
         root (TrieNode): The root node of the Trie.
         size (int): The total number of keys stored in the Trie.
@@ -25,6 +46,7 @@ class Trie:
         """
         self.root = TrieNode()
         self.size = 0
+        self._keys_cache = None  # memoized keys(); dropped on any mutation
 
     def put(self, key, value=None):
         """
@@ -37,20 +59,145 @@ class Trie:
                                    Defaults to None.
 
         Raises:
-            TypeError: If key is not a non-empty string.
+            TypeError: If key is not a non-empty ASCII string.
         """
-        if not isinstance(key, str) or not key:
-            raise TypeError(f"Illegal argument for put: key = {key} must be a non-empty string")
+        if not isinstance(key, str) or not key or not key.isascii():
+            raise TypeError(f"Illegal argument for put: key = {key} must be a non-empty ASCII string")
 
+        self._keys_cache = None
+        TN = TrieNode  # hoisted out of the loop: local loads beat globals
         current = self.root
-        for char in key:
-            if char not in current.children:
-                current.children[char] = TrieNode()
-            current = current.children[char]
+        # Iterating bytes yields small cached ints, not fresh 1-char strings.
+        for idx in key.encode("ascii"):
+            children = current.children
+            nxt = children[idx]
+            if nxt is None:
+                nxt = TN()
+                children[idx] = nxt
+                current.child_count += 1
+            current = nxt
         if current.value is None:
             self.size += 1
         current.value = value
 
+    def put_many(self, items):
+        """
+        Inserts many key-value pairs at once, sharing the walk between
+        consecutive keys.
+
+        The pairs are sorted by key, and for each key the walk restarts
+        from the deepest node it shares with the previous key (kept on an
+        explicit node stack) instead of from the root. For sorted keysets
+        with long shared prefixes this skips a large fraction of the
+        child-slot lookups a put-per-key loop would repeat.
+
+        Args:
+            items (iterable): (key, value) pairs to insert. Later pairs
+                              win when the same key appears twice.
+
+        Returns:
+            list of str: The keys that were newly added (not updates).
+
+        Raises:
+            TypeError: If any key is not a non-empty ASCII string.
+        """
+        pairs = list(items)
+        for key, _ in pairs:
+            if not isinstance(key, str) or not key or not key.isascii():
+                raise TypeError(f"Illegal argument for put_many: key = {key} must be a non-empty ASCII string")
+        pairs.sort(key=lambda kv: kv[0])
+
+        self._keys_cache = None
+        TN = TrieNode
+        stack = [self.root]  # stack[d] is the node for prev[:d]
+        prev = ""
+        added = []
+        for key, value in pairs:
+            n = min(len(prev), len(key))
+            lcp = 0
+            while lcp < n and prev[lcp] == key[lcp]:
+                lcp += 1
+            del stack[lcp + 1:]
+
+            current = stack[-1]
+            for idx in key.encode("ascii")[lcp:]:
+                children = current.children
+                nxt = children[idx]
+                if nxt is None:
+                    nxt = TN()
+                    children[idx] = nxt
+                    current.child_count += 1
+                current = nxt
+                stack.append(current)
+            if current.value is None:
+                self.size += 1
+                added.append(key)
+            current.value = value
+            prev = key
+        return added
+
+    def put_many_parallel(self, items, max_workers=None):
+        """
+        Bulk-inserts key-value pairs by sharding them on the first
+        character and building each shard's subtrie concurrently.
+
+        Shards whose first-character slot is still free in the root are
+        built as independent subtries in a thread pool and attached in
+        one assignment each; shards that would collide with existing
+        subtrees fall back to the sorted batch insert. The shard builds
+        are pure Python and therefore GIL-bound, so wall-clock gains here
+        are modest — the sharding mainly keeps each walk inside one small
+        subtrie.
+
+        Args:
+            items (iterable): (key, value) pairs to insert. Later pairs
+                              win when the same key appears twice.
+            max_workers (int, optional): Thread pool size. Defaults to
+                                         the executor's own default.
+
+        Returns:
+            list of str: The keys that were newly added (not updates).
+
+        Raises:
+            TypeError: If any key is not a non-empty ASCII string.
+        """
+        pairs = list(items)
+        for key, _ in pairs:
+            if not isinstance(key, str) or not key or not key.isascii():
+                raise TypeError(f"Illegal argument for put_many_parallel: key = {key} must be a non-empty ASCII string")
+
+        shards = {}
+        for key, value in pairs:
+            shards.setdefault(ord(key[0]), []).append((key, value))
+
+        self._keys_cache = None
+        root_children = self.root.children
+        free = {slot: shard for slot, shard in shards.items() if root_children[slot] is None}
+        added = []
+
+        def build(shard):
+            sub = Trie()
+            return sub, sub.put_many(shard)
+
+        if free:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {slot: executor.submit(build, shard)
+                           for slot, shard in free.items()}
+            for slot, future in futures.items():
+                sub, sub_added = future.result()
+                root_children[slot] = sub.root.children[slot]
+                self.root.child_count += 1
+                self.size += sub.size
+                added.extend(sub_added)
+
+        leftover = [pair for slot, shard in shards.items()
+                    if slot not in free for pair in shard]
+        if leftover:
+            # Trie.put_many explicitly: subclasses layer their own index
+            # maintenance on top of the combined added-keys list below.
+            added.extend(Trie.put_many(self, leftover))
+        return added
+
     def get(self, key):
         """
         Retrieves the value associated with a given key in the Trie.
@@ -62,51 +209,61 @@ class Trie:
             Any: The value stored for this key, or None if the key does not exist.
 
         Raises:
-            TypeError: If key is not a non-empty string.
+            TypeError: If key is not a non-empty ASCII string.
         """
-        if not isinstance(key, str) or not key:
-            raise TypeError(f"Illegal argument for get: key = {key} must be a non-empty string")
+        if not isinstance(key, str) or not key or not key.isascii():
+            raise TypeError(f"Illegal argument for get: key = {key} must be a non-empty ASCII string")
 
         current = self.root
-        for char in key:
-            if char not in current.children:
+        for idx in key.encode("ascii"):
+            nxt = current.children[idx]
+            if nxt is None:
                 return None
-            current = current.children[char]
+            current = nxt
         return current.value
 
     def delete(self, key):
         """
         Removes a key (and its associated value) from the Trie if it exists.
 
+        Walks down iteratively while recording (parent, slot) pairs, then
+        unwinds the stack pruning nodes left with no children and no
+        value. This avoids one Python call frame per character and any
+        recursion-depth limit on long keys.
+
         Args:
             key (str): The string key to remove.
 
         Raises:
-            TypeError: If key is not a non-empty string.
+            TypeError: If key is not a non-empty ASCII string.
 
         Returns:
-            bool: True if the key was successfully deleted, False otherwise.
+            bool: True if the key was present and removed, False otherwise.
         """
-        if not isinstance(key, str) or not key:
-            raise TypeError(f"Illegal argument for delete: key = {key} must be a non-empty string")
+        if not isinstance(key, str) or not key or not key.isascii():
+            raise TypeError(f"Illegal argument for delete: key = {key} must be a non-empty ASCII string")
 
-        def _delete(node, key, depth):
-            if depth == len(key):
-                if node.value is not None:
-                    node.value = None
-                    self.size -= 1
-                    return len(node.children) == 0
-                return False
+        self._keys_cache = None
 
-            char = key[depth]
-            if char in node.children:
-                should_delete = _delete(node.children[char], key, depth + 1)
-                if should_delete:
-                    del node.children[char]
-                    return len(node.children) == 0 and node.value is None
+        stack = []
+        current = self.root
+        for idx in key.encode("ascii"):
+            nxt = current.children[idx]
+            if nxt is None:
+                return False
+            stack.append((current, idx))
+            current = nxt
+        if current.value is None:
             return False
 
-        return _delete(self.root, key, 0)
+        current.value = None
+        self.size -= 1
+        while stack and current.child_count == 0 and current.value is None:
+            parent, idx = stack.pop()
+            parent.children[idx] = None
+            parent.child_count -= 1
+            current = parent
+        return True
 
     def is_empty(self):
         """
@@ -128,23 +285,21 @@ class Trie:
             str: The longest prefix in the Trie. If no prefix is found, returns "".
 
         Raises:
-            TypeError: If s is not a non-empty string.
+            TypeError: If s is not a non-empty ASCII string.
         """
-        if not isinstance(s, str) or not s:
-            raise TypeError(f"Illegal argument for longestPrefixOf: s = {s} must be a non-empty string")
+        if not isinstance(s, str) or not s or not s.isascii():
+            raise TypeError(f"Illegal argument for longestPrefixOf: s = {s} must be a non-empty ASCII string")
 
         current = self.root
-        longest_prefix = ""
-        current_prefix = ""
-        for char in s:
-            if char in current.children:
-                current = current.children[char]
-                current_prefix += char
-                if current.value is not None:
-                    longest_prefix = current_prefix
-            else:
+        longest_len = 0
+        for depth, idx in enumerate(s.encode("ascii"), start=1):
+            nxt = current.children[idx]
+            if nxt is None:
                 break
-        return longest_prefix
+            current = nxt
+            if current.value is not None:
+                longest_len = depth
+        return s[:longest_len]
 
     def keys_with_prefix(self, prefix):
         """
@@ -157,47 +312,75 @@ class Trie:
             list of str: A list of keys in the Trie that start with the specified prefix.
 
         Raises:
-            TypeError: If prefix is not a string.
+            TypeError: If prefix is not an ASCII string.
         """
-        if not isinstance(prefix, str):
-            raise TypeError(f"Illegal argument for keysWithPrefix: prefix = {prefix} must be a string")
+        if not isinstance(prefix, str) or not prefix.isascii():
+            raise TypeError(f"Illegal argument for keysWithPrefix: prefix = {prefix} must be an ASCII string")
 
         current = self.root
-        for char in prefix:
-            if char not in current.children:
+        for idx in prefix.encode("ascii"):
+            nxt = current.children[idx]
+            if nxt is None:
                 return []
-            current = current.children[char]
+            current = nxt
 
         result = []
-        self._collect(current, list(prefix), result)
+        self._collect(current, prefix, result)
         return result
 
-    def _collect(self, node, path, result):
+    def _collect(self, node, prefix, result):
         """
-        Helper method to recursively collect all keys below the given node.
+        Helper method to collect all keys below the given node.
+
+        Runs an iterative depth-first search with an explicit stack and a
+        single reusable bytearray holding the current path, so no call
+        frames or per-edge path copies are allocated while traversing.
 
         Args:
-            node (TrieNode): The current TrieNode to collect from.
-            path (list of str): The current sequence of characters forming a key.
+            node (TrieNode): The TrieNode to collect from.
+            prefix (str): The characters on the path from the root to 'node'.
             result (list of str): The list to accumulate the full keys.
         """
+        path = bytearray(prefix.encode("ascii"))
         if node.value is not None:
-            result.append("".join(path))
-        for char, next_node in node.children.items():
-            path.append(char)
-            self._collect(next_node, path, result)
-            path.pop()
+            result.append(prefix)
+
+        # Each frame is [node, path length on entry, next child slot to scan].
+        stack = [[node, len(path), 0]]
+        while stack:
+            frame = stack[-1]
+            current, base, slot = frame
+            children = current.children
+            while slot < ALPHABET_SIZE and children[slot] is None:
+                slot += 1
+            if slot == ALPHABET_SIZE:
+                stack.pop()
+                continue
+            frame[2] = slot + 1
+
+            del path[base:]
+            path.append(slot)
+            child = children[slot]
+            if child.value is not None:
+                result.append(path.decode("ascii"))
+            stack.append([child, len(path), 0])
 
     def keys(self):
         """
         Returns a list of all keys stored in the Trie.
 
+        The result is memoized: repeated calls between mutations reuse
+        the collected list instead of re-running the full traversal. Any
+        put or delete drops the cache.
+
         Returns:
             list of str: All the keys in the Trie.
         """
-        result = []
-        self._collect(self.root, [], result)
-        return result
+        if self._keys_cache is None:
+            result = []
+            self._collect(self.root, "", result)
+            self._keys_cache = result
+        return list(self._keys_cache)
 
 
 class Homework(Trie):
@@ -205,13 +388,138 @@ class Homework(Trie):
     Homework class that extends the functionality of the base Trie with two methods:
     1) count_words_with_suffix(pattern)
     2) has_prefix(prefix)
+
+    In addition to the forward trie, a reverse trie is maintained: every
+    stored word is also inserted character-reversed, with pass_count
+    incremented along the path. A suffix query then reduces to walking
+    the reversed pattern and reading pass_count at the node reached,
+    instead of collecting and filtering every key.
     """
+    def __init__(self):
+        """
+        Initializes the Homework trie together with its reverse-trie
+        suffix index.
+        """
+        super().__init__()
+        self.reverse_root = TrieNode()
+
+    def put(self, key, value=None):
+        """
+        Inserts a key-value pair and keeps the suffix index up to date.
+
+        Args:
+            key (str): The string key to insert or update in the Trie.
+            value (Any, optional): The value to associate with the key.
+                                   Defaults to None.
+
+        Raises:
+            TypeError: If key is not a non-empty ASCII string.
+        """
+        size_before = self.size
+        super().put(key, value)
+        if self.size == size_before:
+            return  # existing key updated; suffix counts are unchanged
+        self._reverse_insert(key)
+
+    def put_many(self, items):
+        """
+        Inserts many key-value pairs at once and keeps the suffix index
+        up to date for every newly added key.
+
+        Args:
+            items (iterable): (key, value) pairs to insert.
+
+        Returns:
+            list of str: The keys that were newly added (not updates).
+
+        Raises:
+            TypeError: If any key is not a non-empty ASCII string.
+        """
+        added = super().put_many(items)
+        for key in added:
+            self._reverse_insert(key)
+        return added
+
+    def put_many_parallel(self, items, max_workers=None):
+        """
+        Bulk-inserts key-value pairs concurrently and keeps the suffix
+        index up to date for every newly added key.
+
+        Args:
+            items (iterable): (key, value) pairs to insert.
+            max_workers (int, optional): Thread pool size.
+
+        Returns:
+            list of str: The keys that were newly added (not updates).
+
+        Raises:
+            TypeError: If any key is not a non-empty ASCII string.
+        """
+        added = super().put_many_parallel(items, max_workers=max_workers)
+        for key in added:
+            self._reverse_insert(key)
+        return added
+
+    def _reverse_insert(self, key):
+        """
+        Inserts a newly added key into the reverse-trie suffix index,
+        incrementing pass_count along the reversed path.
+
+        Args:
+            key (str): The key that was just added to the forward trie.
+        """
+        TN = TrieNode
+        current = self.reverse_root
+        current.pass_count += 1
+        for idx in reversed(key.encode("ascii")):
+            children = current.children
+            nxt = children[idx]
+            if nxt is None:
+                nxt = TN()
+                children[idx] = nxt
+                current.child_count += 1
+            current = nxt
+            current.pass_count += 1
+
+    def delete(self, key):
+        """
+        Removes a key and keeps the suffix index up to date.
+
+        Args:
+            key (str): The string key to remove.
+
+        Raises:
+            TypeError: If key is not a non-empty ASCII string.
+
+        Returns:
+            bool: See Trie.delete.
+        """
+        size_before = self.size
+        result = super().delete(key)
+        if self.size == size_before:
+            return result
+
+        current = self.reverse_root
+        current.pass_count -= 1
+        for idx in reversed(key.encode("ascii")):
+            nxt = current.children[idx]
+            nxt.pass_count -= 1
+            if nxt.pass_count == 0:
+                current.children[idx] = None
+                current.child_count -= 1
+                break
+            current = nxt
+        return result
+
     def count_words_with_suffix(self, pattern) -> int:
         """
         Returns the number of words in the Trie that end with 'pattern'.
         Must handle incorrect inputs by raising TypeError if the pattern is not a string.
         Case-sensitive comparisons.
 
+        The reversed pattern is walked through the reverse trie, so each
+        query costs O(len(pattern)) regardless of how many words are stored.
+
         Args:
             pattern (str): The suffix to check.
 
@@ -221,8 +529,21 @@ class Homework(Trie):
         if not isinstance(pattern, str):
             raise TypeError("pattern must be a string")
 
-        all_keys = self.keys()
-        return sum(1 for key in all_keys if key.endswith(pattern))
+        if not pattern.isascii():
+            return 0
+
+        if self.size <= SMALL_TRIE_THRESHOLD:
+            keys = self.keys()
+            if len(keys) == self.size:
+                return sum(1 for key in keys if key.endswith(pattern))
+
+        current = self.reverse_root
+        for idx in reversed(pattern.encode("ascii")):
+            nxt = current.children[idx]
+            if nxt is None:
+                return 0
+            current = nxt
+        return current.pass_count
 
     def has_prefix(self, prefix) -> bool:
         """
@@ -239,11 +560,20 @@ class Homework(Trie):
         if not isinstance(prefix, str):
             raise TypeError("prefix must be a string")
 
+        if not prefix.isascii():
+            return False
+
+        if self.size <= SMALL_TRIE_THRESHOLD:
+            keys = self.keys()
+            if len(keys) == self.size:
+                return any(key.startswith(prefix) for key in keys)
+
         current = self.root
-        for ch in prefix:
-            if ch not in current.children:
+        for idx in prefix.encode("ascii"):
+            nxt = current.children[idx]
+            if nxt is None:
                 return False
-            current = current.children[ch]
+            current = nxt
         return True
 
 
@@ -256,8 +586,11 @@ if __name__ == "__main__":
     # Testing count_words_with_suffix
     assert trie.count_words_with_suffix("e") == 1   # apple
     assert trie.count_words_with_suffix("ion") == 1 # application
-    assert trie.count_words_with_suffix("a") == 1   # banana
     assert trie.count_words_with_suffix("at") == 1  # cat
+    assert trie.count_words_with_suffix("") == 4    # every word ends with ""
+    assert trie.count_words_with_suffix("zzz") == 0
+    assert trie.count_words_with_suffix("banana") == 1  # whole word as suffix
+    assert trie.count_words_with_suffix("a") == 1   # banana
 
     # Testing has_prefix
     assert trie.has_prefix("app") == True   # "apple", "application"
@@ -265,4 +598,12 @@ if __name__ == "__main__":
     assert trie.has_prefix("ban") == True   # "banana"
     assert trie.has_prefix("ca") == True    # "cat"
 
+    # Suffix counts must track mutations without rescanning the keys
+    trie.put("banana", 99)  # value update, not a new word
+    assert trie.count_words_with_suffix("a") == 1   # banana
+    assert trie.delete("banana") == True
+    assert trie.delete("banana") == False  # already gone
+    assert trie.count_words_with_suffix("a") == 0
+    assert trie.count_words_with_suffix("") == 3
+
     print("All tests passed successfully!")